@@ -1,6 +1,7 @@
 
 import sys
 import gc
+import functools
 import io
 import os
 import json
@@ -26,12 +27,16 @@ from PyQt6.QtWidgets import (
 # ---------------------------------------------------------------------------
 # Matplotlib – imported eagerly (needed for DraggableCanvas widgets at init)
 # ---------------------------------------------------------------------------
+import matplotlib
 import matplotlib.lines as mlines
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib import colormaps, rcParams
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
-from matplotlib.colors import ListedColormap
+from matplotlib.collections import LineCollection
+from matplotlib.colors import BoundaryNorm, ListedColormap, Normalize, to_rgba_array
 from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+from matplotlib.ticker import FuncFormatter, MaxNLocator
 
 # ---------------------------------------------------------------------------
 # Background pre-loader for heavy optional libraries
@@ -43,24 +48,18 @@ from matplotlib.figure import Figure
 
 _preload_ready = threading.Event()
 _pd = None
-_scipy_zoom = None
 _fitz = None
 _PILImage = None
 
 
 def _preload_heavy_libs():
-    """Import pandas, scipy, fitz, PIL in a background thread."""
-    global _pd, _scipy_zoom, _fitz, _PILImage
+    """Import pandas, fitz, PIL in a background thread."""
+    global _pd, _fitz, _PILImage
     try:
         import pandas
         _pd = pandas
     except ImportError:
         pass
-    try:
-        from scipy.ndimage import zoom
-        _scipy_zoom = zoom
-    except ImportError:
-        pass
     try:
         import fitz
         _fitz = fitz
@@ -77,7 +76,7 @@ def _preload_heavy_libs():
 def _wait_for_preload():
     """Block (briefly) until the background preload has finished.
 
-    Called at the start of any function that needs pandas/scipy/fitz/PIL.
+    Called at the start of any function that needs pandas/fitz/PIL.
     If the preload already finished (typical), this returns instantly.
     """
     _preload_ready.wait()
@@ -97,13 +96,6 @@ def _get_pandas():
     return _pd
 
 
-def _get_scipy_zoom():
-    _wait_for_preload()
-    if _scipy_zoom is None:
-        raise ImportError("scipy is not installed.  pip install scipy")
-    return _scipy_zoom
-
-
 def _get_fitz():
     _wait_for_preload()
     if _fitz is None:
@@ -228,10 +220,152 @@ def _resolve_cmap(name_or_obj):
             return get_threat_zone_cmap()
         elif name_or_obj == "Dose Field (7)":
             return get_continuous_dose_cmap()
-        return plt.get_cmap(name_or_obj).copy()
+        return colormaps[name_or_obj]  # The registry hands out copies
     return name_or_obj.copy() if hasattr(name_or_obj, 'copy') else name_or_obj
 
 
+def _overlay_cmap(name_or_obj):
+    """Colormap for the intensity overlay: opaque top colour above vmax,
+    fully transparent below vmin.
+
+    Colormaps for names are built once and shared between draws; nothing
+    modifies an overlay colormap after it is made.
+    """
+    if isinstance(name_or_obj, str):
+        return _named_overlay_cmap(name_or_obj)
+    return _build_overlay_cmap(name_or_obj)
+
+
+@functools.lru_cache(maxsize=16)
+def _named_overlay_cmap(name):
+    return _build_overlay_cmap(name)
+
+
+def _build_overlay_cmap(name_or_obj):
+    cmap_obj = _resolve_cmap(name_or_obj)
+    top_color = list(cmap_obj(1.0))
+    top_color[3] = 1.0
+    cmap_obj.set_over(tuple(top_color))
+    cmap_obj.set_under((0, 0, 0, 0))
+    return cmap_obj
+
+
+@functools.lru_cache(maxsize=8)
+def _linear_taps(n_in, n_out):
+    """Source indices and weights for resizing one axis from *n_in* to
+    *n_out* samples, corner-aligned (as ``scipy.ndimage.zoom`` does).
+
+    Returns read-only ``(i0, i1, frac)``; output ``k`` is
+    ``src[i0[k]] * (1 - frac[k]) + src[i1[k]] * frac[k]``.
+    """
+    scale = (n_in - 1) / (n_out - 1) if n_out > 1 else 0.0
+    pos = np.arange(n_out) * scale
+    i0 = np.minimum(pos.astype(np.intp), max(n_in - 2, 0))
+    i1 = np.minimum(i0 + 1, n_in - 1)
+    frac = (pos - i0).astype(np.float32)
+    for a in (i0, i1, frac):
+        a.flags.writeable = False
+    return i0, i1, frac
+
+
+def _upsample_intensity(raw: np.ndarray, out_h: int, out_w: int) -> np.ndarray:
+    """Bilinearly resize the raw intensity grid to ``(out_h, out_w)``.
+
+    The result is float32.  A same-size request is returned as a copy
+    (corner-aligned sampling maps it onto itself); otherwise two vectorised
+    1-D passes (rows, then columns) are applied.
+    """
+    raw = np.ascontiguousarray(raw, dtype=np.float32)
+    if raw.shape == (out_h, out_w):
+        return raw.copy()
+    y0, y1, fy = _linear_taps(raw.shape[0], out_h)
+    rows = raw[y0] * (1 - fy)[:, None] + raw[y1] * fy[:, None]
+    x0, x1, fx = _linear_taps(raw.shape[1], out_w)
+    return rows[:, x0] * (1 - fx) + rows[:, x1] * fx
+
+
+# Samples per table cell when contouring highlight lines.  Bilinear
+# iso-lines curve inside a cell; 8 steps keep them within a pixel or so.
+HIGHLIGHT_SUBSTEPS = 8
+
+# Highlight line palette, cycled per value; parsed to RGBA once at import.
+HIGHLIGHT_COLORS = to_rgba_array(["white", "black", "red", "yellow", "green", "cyan"])
+
+# Re-targeting a colorbar at a new mappable moves matplotlib's undocumented
+# ``colorbar``/``colorbar_cid`` link (what ``Colorbar.remove`` relies on),
+# which has been stable from 3.5 through 3.11.  Other versions rebuild it.
+_COLORBAR_RETARGET = (3, 5) <= matplotlib.__version_info__[:2] <= (3, 11)
+
+
+@functools.lru_cache(maxsize=8)
+def _grid_geometry(width, height, cols, rows):
+    """Return ``(xs, ys, segments)`` for a cols x rows grid over an image.
+
+    *xs*/*ys* are the flat coordinates of every grid point; *segments* is an
+    ``(n, 2, 2)`` array of the vertical then horizontal lines.  Results are
+    cached and returned read-only, as they are shared between calls.
+    """
+    x = np.linspace(0, width, cols + 1)
+    y = np.linspace(0, height, rows + 1)
+    xs = np.tile(x, rows + 1)
+    ys = np.repeat(y, cols + 1)
+
+    segments = np.empty((cols + rows + 2, 2, 2))
+    segments[:cols + 1, :, 0] = x[:, None]
+    segments[:cols + 1, :, 1] = (0, height)
+    segments[cols + 1:, :, 0] = (0, width)
+    segments[cols + 1:, :, 1] = y[:, None]
+
+    for arr in (xs, ys, segments):
+        arr.flags.writeable = False
+    return xs, ys, segments
+
+
+def _rounded_ticks(lo, hi, count, step=50):
+    """*count* ticks spread over [lo, hi], rounded to multiples of *step*.
+
+    0 is included when in range; the result is sorted and de-duplicated
+    (rounding can map neighbouring ticks onto the same value).
+    """
+    ticks = np.round(np.linspace(lo, hi, count) / step) * step
+    if lo <= 0 <= hi:
+        ticks = np.append(ticks, 0)
+    return np.unique(ticks) + 0.0  # + 0.0 turns -0.0 into 0.0
+
+
+def _band_cmap(cmap_obj, levels):
+    """One colour per band between *levels*, chosen as ``contourf`` does:
+    *cmap_obj* at each band's midpoint, over the levels' range."""
+    mids = 0.5 * (levels[:-1] + levels[1:])
+    return ListedColormap(cmap_obj((mids - levels[0]) / (levels[-1] - levels[0])))
+
+
+def _auto_levels(data, n):
+    """The levels ``contourf(data, levels=n)`` picks: "nice" steps from a
+    MaxNLocator, trimmed to just cover the data range."""
+    zmin, zmax = np.nanmin(data), np.nanmax(data)
+    lev = MaxNLocator(n + 1, min_n_ticks=1).tick_values(zmin, zmax)
+    under = np.nonzero(lev < zmin)[0]
+    i0 = under[-1] if len(under) else 0
+    over = np.nonzero(lev > zmax)[0]
+    i1 = over[0] + 1 if len(over) else len(lev)
+    if i1 - i0 < 3:
+        i0, i1 = 0, len(lev)
+    return lev[i0:i1]
+
+
+def _format_int_tick(x, pos):
+    return f'{x:.0f}'
+
+
+def _cell_float(text):
+    """Parse a table cell's text; blank or invalid text counts as 0."""
+    try:
+        return float(text) if text else 0.0
+    except ValueError:
+        return 0.0
+
+
 def _pixmap_to_rgb_array(pixmap: QPixmap) -> np.ndarray:
 
     image = pixmap.toImage().convertToFormat(QImage.Format.Format_RGB888)
@@ -239,16 +373,15 @@ def _pixmap_to_rgb_array(pixmap: QPixmap) -> np.ndarray:
     if w == 0 or h == 0:
         return np.zeros((1, 1, 3), dtype=np.uint8)
     bpl = image.bytesPerLine()  # may include row padding
-    # -- Critical: copy the raw bytes OUT of Qt's buffer immediately --
-    # image.constBits() returns a sip.voidptr that becomes dangling if
-    # `image` is garbage-collected.  Using image.bits().asstring()
-    # copies the data into a Python bytes object, decoupling lifetimes.
     ptr = image.constBits()
-    ptr.setsize(bpl * h)
-    raw = bytes(ptr)  # copy Qt's buffer into a Python bytes object
-    arr = np.frombuffer(raw, dtype=np.uint8).reshape((h, bpl))
-    # Strip any row padding (bpl may be > w*3) and return a contiguous copy
-    return arr[:, :w * 3].reshape((h, w, 3)).copy()
+    ptr.setsize(image.sizeInBytes())
+    # Strided view straight onto Qt's buffer; the row stride skips any
+    # padding (bpl may be > w*3).  RGB888 is byte-ordered, so no BGR swap.
+    view = np.ndarray((h, w, 3), dtype=np.uint8, buffer=ptr, strides=(bpl, 3, 1))
+    # -- Critical: exactly one contiguous copy OUT of Qt's buffer --
+    # The sip.voidptr dangles once `image` is garbage-collected, so the
+    # view must not escape this function.
+    return view.copy()
 
 
 def _safe_load_raster_image(file_path: str) -> QPixmap | None:
@@ -1032,8 +1165,23 @@ class DraggableCanvas(FigureCanvasQTAgg):
         self.dragging = False
         self.last_mouse_pos = None
         self.cbar = None
+        self._cbar_extend = None  # ``extend`` self.cbar was created with
         self.intensity_offset_x = 0
         self.intensity_offset_y = 0
+        # Background AxesImage, reused while the pixmap is unchanged
+        self._base_im = None
+        self._base_key = None
+        self._base_size = None
+        # Heatmap AxesImage and cached blit background for restyle_overlay
+        self._overlay_im = None
+        self._overlay_clip = None
+        self._blit_bg = None
+        self.highlight_cs = None  # ContourSet drawn by apply_highlights
+        # Grid artists owned by draw_grid, updated in place
+        self._grid_points = None
+        self._grid_lines = None
+        self._grid_state = None  # (pixmap key, cols, rows, points) last drawn
+        self.mpl_connect('draw_event', self._on_draw_event)
         self.original_extent = None
 
     # --- Mouse interaction for dragging ------------------------------------
@@ -1069,38 +1217,55 @@ class DraggableCanvas(FigureCanvasQTAgg):
 
                 moved_something = False
 
+                if self._overlay_clip is not None:
+                    x, y = self._overlay_clip.get_xy()
+                    self._overlay_clip.set_xy((x + dx, y + dy))
+
                 for img in self.ax.images:
-                    arr = img.get_array()
-                    if arr is None:
-                        continue
-                    if hasattr(arr, 'dtype') and arr.dtype == np.uint8:
-                        # Skip the base image drawn from pixmap
-                        continue
+                    if img is self._base_im:
+                        continue  # The background stays put
 
                     extent = img.get_extent()
                     new_extent = (extent[0] + dx, extent[1] + dx, extent[2] + dy, extent[3] + dy)
                     img.set_extent(new_extent)
+                    if self._overlay_clip is not None:
+                        # The clip path is cached when set, so set it again
+                        img.set_clip_path(self._overlay_clip)
                     moved_something = True
 
                 # Handle collection objects (contours)
                 for collection in self.ax.collections:
+                    if collection is self._grid_lines:
+                        continue  # The grid stays fixed to the image
                     for path in collection.get_paths():
                         vertices = path.vertices
                         vertices[:, 0] += dx
                         vertices[:, 1] += dy
                     moved_something = True
 
+                # Highlight labels follow their (already shifted) lines
+                if self.highlight_cs is not None:
+                    for label in self.highlight_cs.labelTexts:
+                        x, y = label.get_position()
+                        label.set_position((x + dx, y + dy))
+
                 if moved_something:
                     self.last_mouse_pos = (x_data, y_data)
-                    self.draw()
+                    # Only the overlay moves: blit it over the cached
+                    # background instead of redrawing the whole figure
+                    self._blit_overlay()
 
             except Exception as e:
                 print(f"Drag error: {e}")
                 self.dragging = False
 
     def mouseReleaseEvent(self, event):
-        """After drag, re-apply highlights so contour lines + labels
-        stay consistent with the moved overlay"""
+        """After drag, re-apply highlights if they are not on the axes.
+
+        Highlights that are still drawn were translated with the overlay
+        during the drag, so they are kept as they are rather than
+        re-extracted.
+        """
         if event.button() == Qt.MouseButton.LeftButton:
             self.dragging = False
             self.last_mouse_pos = None
@@ -1108,6 +1273,9 @@ class DraggableCanvas(FigureCanvasQTAgg):
             # Re-apply highlights after drag if any were set (Option 1 behaviour)
             try:
                 if (
+                    self.highlight_cs is None
+                    or self.highlight_cs.axes is not self.ax
+                ) and (
                     hasattr(self, "parent_window")
                     and self.parent_window is not None
                     and hasattr(self.parent_window, "last_highlight_values")
@@ -1119,27 +1287,83 @@ class DraggableCanvas(FigureCanvasQTAgg):
 
     # --- Helper: prepare axes with background image ------------------------
 
-    def _prepare_axes(self, base_img: QPixmap):
-        """Clear figure, create fresh axes, draw background image.
+    def _prepare_axes(self, base_img: QPixmap, colorbar_extend=None):
+        """Clear the axes and draw the background image.
+
+        While *base_img* is unchanged (same ``cacheKey``) the axes are only
+        cleared and the existing background AxesImage is re-attached, which
+        skips the pixmap-to-array conversion and a fresh ``imshow``.  The
+        colorbar is kept for ``_set_colorbar`` to re-target if it has the
+        *colorbar_extend* the new draw needs (and ``_COLORBAR_RETARGET``
+        allows it); otherwise it is removed.
 
         Returns (extent, width, height) for the background.
         """
+        if (not _COLORBAR_RETARGET or colorbar_extend is None
+                or colorbar_extend != self._cbar_extend):
+            # Before clearing: Colorbar.remove() restores the parent axes'
+            # layout through the mappable, which cla() detaches.
+            self._remove_colorbar()
+        self._overlay_im = None
+        self._overlay_clip = None
+        self.highlight_cs = None
+
+        key = base_img.cacheKey()
+        if (self._base_im is not None and self._base_key == key
+                and self.ax in self.figure.axes):
+            self.ax.cla()
+            self.ax.add_image(self._base_im)
+            self.ax.set_aspect('equal')
+            return (self.original_extent, *self._base_size)
+
+        self._remove_colorbar()
         self.figure.clf()
-        if self.cbar is not None:
-            try:
-                self.cbar.remove()
-            except Exception:
-                pass
-            self.cbar = None
         self.ax = self.figure.add_subplot(111)
 
         arr_rgb = _pixmap_to_rgb_array(base_img)
         height, width = arr_rgb.shape[:2]
         extent = [-width / 2, width / 2, -height / 2, height / 2]
         self.original_extent = extent
-        self.ax.imshow(arr_rgb, aspect='equal', extent=extent, origin='upper')
+        self._base_im = self.ax.imshow(arr_rgb, aspect='equal', extent=extent, origin='upper')
+        self._base_key = key
+        self._base_size = (width, height)
         return extent, width, height
 
+    def _remove_colorbar(self):
+        if self.cbar is not None:
+            try:
+                self.cbar.remove()
+            except Exception:
+                pass
+            self.cbar = None
+        self._cbar_extend = None
+
+    def _set_colorbar(self, im, extend):
+        """Point the colorbar at *im*, creating it only when needed.
+
+        A colorbar kept by ``_prepare_axes`` (same *extend*, which cannot
+        be changed afterwards) is re-targeted instead of rebuilt, also
+        across heatmap and contour draws; this saves the layout pass and
+        the fresh tick artists of a new colorbar axes.  Tick and label
+        styling is reset so it looks like a new one; callers then apply
+        their own.
+        """
+        cbar = self.cbar
+        if cbar is not None and self._cbar_extend == extend:
+            old = cbar.mappable
+            if old is not im:
+                old.callbacks.disconnect(old.colorbar_cid)
+                old.colorbar = old.colorbar_cid = None
+                im.colorbar = cbar
+                im.colorbar_cid = im.callbacks.connect('changed', cbar.update_normal)
+            cbar.update_normal(im)
+            cbar.ax.tick_params(labelsize=rcParams['ytick.labelsize'])
+            cbar.ax.yaxis.label.set_fontstyle('normal')
+            return cbar
+        self.cbar = self.figure.colorbar(im, ax=self.ax, orientation='vertical', pad=0.05, extend=extend)
+        self._cbar_extend = extend
+        return self.cbar
+
     def _intensity_extent(self, extent):
         """Return the overlay extent shifted by the current drag offset."""
         return [
@@ -1149,6 +1373,17 @@ class DraggableCanvas(FigureCanvasQTAgg):
             extent[3] + self.intensity_offset_y,
         ]
 
+    def region_box(self, region=None):
+        """Return the data-space ``(x0, x1, y0, y1)`` of an overlay region.
+
+        *region* is ``(left, right, top, bottom)`` as fractions of the
+        overlay extent (default: all of it); the drag offset is included.
+        """
+        ie = self._intensity_extent(self.original_extent)
+        left, right, top, bottom = region or (0.0, 1.0, 0.0, 1.0)
+        w, h = ie[1] - ie[0], ie[3] - ie[2]
+        return ie[0] + left * w, ie[0] + right * w, ie[3] - bottom * h, ie[3] - top * h
+
     # --- Drawing methods ---------------------------------------------------
 
     def draw_heatmap(
@@ -1163,39 +1398,131 @@ class DraggableCanvas(FigureCanvasQTAgg):
         units='',
         scale_x=1.0,
         scale_y=1.0,
-        distance_units='pixels'
+        distance_units='pixels',
+        region=None
     ):
-        """Draw (or redraw) a heatmap overlay on the background image."""
-        extent, width, height = self._prepare_axes(base_img)
-        intensity_extent = self._intensity_extent(extent)
+        """Draw (or redraw) a heatmap overlay on the background image.
 
-        cmap_obj = _resolve_cmap(cmap)
-        cmap_obj.set_over(cmap_obj(1.0))
-        top_color = list(cmap_obj(1.0))
-        top_color[3] = 1.0
-        cmap_obj.set_over(tuple(top_color))
-        cmap_obj.set_under((0, 0, 0, 0))
+        *intensity_array* may be the raw table grid: its samples are placed
+        corner-to-corner over *region* (see ``region_box``) and Matplotlib
+        interpolates the data at display resolution, so no image-sized
+        array is needed.
+        """
+        extent, width, height = self._prepare_axes(base_img, colorbar_extend='max')
 
-        im = self.ax.imshow(
-            intensity_array,
+        cmap_obj = _overlay_cmap(cmap)
+        # A ready-made norm skips imshow's set_clim() round of change
+        # callbacks; unset limits are still autoscaled from the data.
+        im = self._imshow_region(
+            intensity_array, region,
             cmap=cmap_obj,
             alpha=alpha,
             interpolation=interpolation,
-            extent=intensity_extent,
-            origin='upper',
-            vmin=vmin,
-            vmax=vmax
+            norm=Normalize(vmin=vmin, vmax=vmax)
         )
 
         self.ax.set_xlim(extent[0], extent[1])
         self.ax.set_ylim(extent[2], extent[3])
         self._apply_axis_scaling(scale_x, scale_y, distance_units)
 
-        self.cbar = self.figure.colorbar(im, ax=self.ax, orientation='vertical', pad=0.05, extend='max')
+        self._set_colorbar(im, 'max')
         cbar_label = f'Intensity ({units})' if units else 'Intensity'
         self.cbar.set_label(cbar_label, rotation=270, labelpad=20, fontsize=15, fontweight='bold')
+        self._overlay_im = im
         self.draw()
 
+    def _imshow_region(self, grid, region, **kwargs):
+        """``imshow`` *grid* with its samples placed corner-to-corner over
+        *region* (see ``region_box``), interpolated in data space.
+        """
+        x0, x1, y0, y1 = self.region_box(region)
+
+        # imshow centres samples in their cells; pad by half a cell so the
+        # outer samples land on the region edges, then clip to the region.
+        rows, cols = grid.shape
+        half_x = (x1 - x0) / (2 * (cols - 1)) if cols > 1 else 0.0
+        half_y = (y1 - y0) / (2 * (rows - 1)) if rows > 1 else 0.0
+        im = self.ax.imshow(
+            grid,
+            interpolation_stage='data',
+            extent=[x0 - half_x, x1 + half_x, y0 - half_y, y1 + half_y],
+            origin='upper',
+            **kwargs
+        )
+        self._overlay_clip = Rectangle((x0, y0), x1 - x0, y1 - y0, transform=self.ax.transData)
+        im.set_clip_path(self._overlay_clip)
+        return im
+
+    # --- Blitted overlay restyling ------------------------------------------
+
+    def restyle_overlay(self, alpha=None, cmap=None, clim=None) -> bool:
+        """Change the heatmap's alpha/colormap/(vmin, vmax) without a full redraw.
+
+        Returns False when there is no heatmap overlay to restyle (e.g. the
+        contour view is showing); the caller should redraw instead.
+        """
+        im = self._overlay_im
+        if im is None or im.axes is not self.ax or self.cbar is None:
+            return False
+        if alpha is not None:
+            im.set_alpha(alpha)
+        if cmap is not None:
+            im.set_cmap(_overlay_cmap(cmap))
+        if clim is not None:
+            im.set_clim(*clim)
+        self.cbar.update_normal(im)
+        self._blit_overlay()
+        return True
+
+    def invalidate_overlay(self):
+        """Make the next restyle_overlay() fall back to a full redraw."""
+        self._overlay_im = None
+
+    def _overlay_artists(self):
+        """Everything drawn over the background image, in draw order.
+
+        Spines and axes (zorder 2.5) sit on top of the overlay in a normal
+        draw, so they are redrawn after it as well.
+        """
+        ax = self.ax
+        artists = [a for a in ax.images if a is not self._base_im]
+        artists += ax.collections + ax.lines + ax.texts
+        artists += [*ax.spines.values(), ax.xaxis, ax.yaxis]
+        if ax.legend_ is not None:
+            artists.append(ax.legend_)
+        artists.sort(key=lambda a: a.get_zorder())
+        if self.cbar is not None:
+            artists.append(self.cbar.ax)
+        return [a for a in artists if a.get_visible()]
+
+    def _blit_overlay(self, bbox=None):
+        """Restore the cached background and redraw only the overlay.
+
+        The background (figure minus overlay, highlights and colorbar) is
+        captured on the first call after any full draw.  Only *bbox*
+        (default: the whole figure) is copied to the widget, so callers whose
+        changes stay inside a smaller area can pass it.
+        """
+        artists = self._overlay_artists()
+        if self._blit_bg is None:
+            for a in artists:
+                a.set_visible(False)
+            try:
+                self.draw()
+                bg = self.copy_from_bbox(self.figure.bbox)
+            finally:
+                for a in artists:
+                    a.set_visible(True)
+            self._blit_bg = bg
+        self.restore_region(self._blit_bg)
+        for a in artists:
+            self.figure.draw_artist(a)
+        self.blit(bbox if bbox is not None else self.figure.bbox)
+
+    def _on_draw_event(self, event):
+        # Any full draw (resize, drag, new overlay) invalidates the background
+        self._blit_bg = None
+
     def _apply_axis_scaling(self, scale_x, scale_y, distance_units):
         """Scale axis tick labels and set axis labels."""
         if scale_x != 1.0 or scale_y != 1.0:
@@ -1223,58 +1550,142 @@ class DraggableCanvas(FigureCanvasQTAgg):
         extend='max',
         scale_x=1.0,
         scale_y=1.0,
-        distance_units='pixels'
+        distance_units='pixels',
+        vrange=None,
+        region=None
     ):
-        """Draw (or redraw) filled contour overlay on the background image."""
-        extent, width, height = self._prepare_axes(base_img)
-
-        rows, cols = intensity_array.shape
-
-        ie = self._intensity_extent(extent)
-        X = np.linspace(ie[0], ie[1], cols)
-        Y = np.linspace(ie[2], ie[3], rows)
-        xx, yy = np.meshgrid(X, Y)
+        """Draw (or redraw) filled contour overlay on the background image.
 
+        *intensity_array* may be the raw table grid, placed over *region* as
+        in ``draw_heatmap``.  *vrange* is an optional precomputed
+        ``(min, max)`` used to spread integer *levels*.
+        """
         if isinstance(levels, int):
-            valid_data = intensity_array[~np.isnan(intensity_array)]
-            if valid_data.size == 0:
-                return
-            vmin, vmax = np.min(valid_data), np.max(valid_data)
-            levels = np.linspace(vmin, vmax, levels)
-
-        intensity_array = np.flipud(intensity_array)
-
-        cmap_obj = _resolve_cmap(cmap)
-        top_color = list(cmap_obj(1.0))
-        top_color[3] = 1.0
-        cmap_obj.set_over(tuple(top_color))
-        cmap_obj.set_under((0, 0, 0, 0))
-
-        cs = self.ax.contourf(xx, yy, intensity_array, levels=levels, cmap=cmap_obj, alpha=alpha, extend=extend)
+            if vrange is None:
+                valid_data = intensity_array[~np.isnan(intensity_array)]
+                if valid_data.size == 0:
+                    return
+                vrange = np.min(valid_data), np.max(valid_data)
+            levels = np.linspace(vrange[0], vrange[1], levels)
+        levels = np.asarray(levels, dtype=float)
+        if levels.size < 2 or np.any(np.diff(levels) <= 0):
+            raise ValueError("Contour levels must be increasing")
+
+        extent, width, height = self._prepare_axes(base_img, colorbar_extend=extend)
+
+        # Filled contours of the interpolated surface are just its bands, so
+        # draw the grid as an image and let a BoundaryNorm pick each display
+        # pixel's band instead of tessellating contour polygons.
+        cmap_obj = _overlay_cmap(cmap)
+        band_cmap = _band_cmap(cmap_obj, levels)
+        # contourf's scalar alpha replaced each band colour's own, so an
+        # extended end drew its under/over colour made opaque, at *alpha*.
+        transparent = (0, 0, 0, 0)
+        under = (*cmap_obj.get_under()[:3], 1.0)
+        band_cmap.set_bad(transparent)
+        band_cmap.set_under(under if extend in ('min', 'both') else transparent)
+        band_cmap.set_over(cmap_obj.get_over() if extend in ('max', 'both') else transparent)
+
+        im = self._imshow_region(
+            intensity_array, region,
+            cmap=band_cmap,
+            norm=BoundaryNorm(levels, band_cmap.N),
+            alpha=alpha,
+            interpolation=interpolation,
+        )
 
         self.ax.set_xlim(extent[0], extent[1])
         self.ax.set_ylim(extent[2], extent[3])
         self._apply_axis_scaling(scale_x, scale_y, distance_units)
 
-        self.cbar = self.figure.colorbar(cs, ax=self.ax, orientation='vertical', pad=0.05)
+        self._set_colorbar(im, extend)
         cbar_label = f'Intensity ({units})' if units else 'Intensity'
         self.cbar.set_label(cbar_label, rotation=270, labelpad=15, fontsize=14, fontweight='bold')
         self.cbar.ax.tick_params(labelsize=13)
         self.draw()
 
+    def draw_grid(self, base_img: QPixmap, cols, rows, points=True):
+        """Draw a grid of points or dotted lines over the background image.
+
+        The background AxesImage and grid artists are created once and then
+        updated in place.  While *base_img* is unchanged (same ``cacheKey``)
+        only the grid artists change and are blitted over the cached
+        background.  A call that would draw exactly what is already shown
+        does nothing.
+        """
+        key = base_img.cacheKey()
+        state = (key, cols, rows, points)
+        axes_ready = (self._base_im is not None and self._base_im in self.ax.images
+                      and self._grid_points in self.ax.lines)
+        if axes_ready and self._base_key == key:
+            if state == self._grid_state:
+                return
+            full_draw = False
+        else:
+            arr_rgb = _pixmap_to_rgb_array(base_img)
+            height, width = arr_rgb.shape[:2]
+            extent = [0, width, 0, height]
+            if axes_ready:
+                # New background (e.g. rotated): swap the pixels in place
+                self._base_im.set_data(arr_rgb)
+                self._base_im.set_extent(extent)
+            else:
+                self.ax.clear()
+                self._base_im = self.ax.imshow(arr_rgb, aspect='equal', extent=extent, origin='upper')
+                self._grid_points, = self.ax.plot([], [], 'r.', markersize=2)
+                self._grid_lines = LineCollection([], colors='red', linestyles=':', linewidths=0.5)
+                self.ax.add_collection(self._grid_lines, autolim=False)
+            self.original_extent = extent
+            self._base_key = key
+            self._base_size = (width, height)
+            self.ax.set_xlim([0, width])
+            self.ax.set_ylim([0, height])
+            full_draw = True
+
+        xs, ys, segments = _grid_geometry(*self._base_size, cols, rows)
+        if points:
+            self._grid_points.set_data(xs, ys)
+        else:
+            self._grid_lines.set_segments(segments)
+        self._grid_points.set_visible(points)
+        self._grid_lines.set_visible(not points)
+        self._grid_state = state
+
+        if full_draw:
+            # Coalesced with any other pending redraw; the blit background
+            # is stale until that draw has happened.
+            self._blit_bg = None
+            self.draw_idle()
+        else:
+            # Grid artists are clipped to the axes; pad for the pixel
+            # rounding in blit()
+            self._blit_overlay(self.ax.bbox.padded(1))
+
     def reset_intensity_position(self):
         self.intensity_offset_x = 0
         self.intensity_offset_y = 0
 
+    def release(self):
+        """Clear the figure and drop every cached artist and blit buffer.
+
+        The cached artists would otherwise keep their (cleared) figure's
+        renderer data alive after the canvas is closed.
+        """
+        self._remove_colorbar()
+        self.figure.clear()
+        self._base_im = None
+        self._base_key = None
+        self._overlay_im = None
+        self._overlay_clip = None
+        self._blit_bg = None
+        self.highlight_cs = None
+        self._grid_points = None
+        self._grid_lines = None
+        self._grid_state = None
+
     def closeEvent(self, event):
         try:
-            if self.cbar is not None:
-                try:
-                    self.cbar.remove()
-                except Exception:
-                    pass
-            self.figure.clear()
-            plt.close(self.figure)
+            self.release()
         except Exception:
             pass
         gc.collect()  # Cleanup on close only
@@ -1339,10 +1750,7 @@ class MainWindow(QMainWindow):
         self.alpha = 0.6
         self.cmap = "jet"
         self._current_vis_mode = "heatmap"
-        self.cached_intensity_array = None
-        self.last_csv_data = None
-        self.last_csv_shape = None
-        self.last_pixmap_size = None
+        self._intensity_range = None   # (table mirror, (min, max))
         self.current_rotation_angle = 0
         self.source_type = None  # 'pdf', 'image', 'heic', etc.
         self.source_path = None  # filesystem path to original
@@ -1357,6 +1765,22 @@ class MainWindow(QMainWindow):
         self.last_highlight_values = []
         self.last_highlight_color_mode = None
 
+        # Slider/spin redraws are coalesced to one per frame.  Each distinct
+        # action runs once (in request order) and renders from current state,
+        # so repeats collapse but e.g. an alpha restyle and a clim change
+        # made within the same frame both apply.
+        self._redraw_actions = {}
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(16)
+        self._redraw_timer.timeout.connect(self._do_redraw)
+
+        # Row/column add/remove bursts share one preview + spinbox refresh.
+        self._table_refresh_timer = QTimer(self)
+        self._table_refresh_timer.setSingleShot(True)
+        self._table_refresh_timer.setInterval(50)
+        self._table_refresh_timer.timeout.connect(self._refresh_table_views)
+
         self.setWindowTitle("Radiation Protection Scatter Map Generator")
         self._dark_theme_on = False
 
@@ -1591,7 +2015,7 @@ class MainWindow(QMainWindow):
         # --- Tab 2: Intensity Data ---
         self.table_widget = QTableWidget()
         self.table_widget.setEditTriggers(QTableWidget.EditTrigger.AllEditTriggers)
-        self.table_widget.cellChanged.connect(self.invalidate_cache)
+        self.table_widget.cellChanged.connect(self._on_cell_changed)
 
         intensity_layout = QHBoxLayout()
         intensity_left = QVBoxLayout()
@@ -1637,6 +2061,7 @@ class MainWindow(QMainWindow):
         self._preview_canvas_layout = QVBoxLayout(self._preview_canvas_holder)
         self._preview_canvas_layout.setContentsMargins(0, 0, 0, 0)
         self.preview_canvas = None  # created lazily
+        self._preview_bg = None     # (key, RGB array) scaled to the preview
         intensity_right.addWidget(self._preview_canvas_holder)
         self.preview_mode_combo.currentTextChanged.connect(self.update_intensity_preview)
 
@@ -1779,8 +2204,10 @@ class MainWindow(QMainWindow):
         scale_controls.addWidget(self.vmax_spin)
 
         blend_right.addLayout(scale_controls)
-        self.vmin_spin.valueChanged.connect(self.update_colormap_scale)
-        self.vmax_spin.valueChanged.connect(self.update_colormap_scale)
+        self.vmin_spin.valueChanged.connect(
+            lambda: self._schedule_redraw(self.update_colormap_scale))
+        self.vmax_spin.valueChanged.connect(
+            lambda: self._schedule_redraw(self.update_colormap_scale))
 
         # Axis scale and units
         axis_group = QGroupBox("Axis Scale and Units")
@@ -1899,11 +2326,6 @@ class MainWindow(QMainWindow):
             Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         blend_layout.addWidget(blend_scroll, stretch=1)
 
-        self.measuring = False
-        self.measurement_points = []
-        self.measurement_lines = []
-        self.measurement_annotation = None
-
         blend_tab = QWidget()
         blend_tab.setLayout(blend_layout)
         self.tab_widget.addTab(blend_tab, "Blended")
@@ -1950,8 +2372,8 @@ class MainWindow(QMainWindow):
         grid_layout.addLayout(grid_right, stretch=1)
 
         grid_tab.setLayout(grid_layout)
-        self.grid_nx_spin.valueChanged.connect(self.show_grid_overlay)
-        self.grid_ny_spin.valueChanged.connect(self.show_grid_overlay)
+        self.grid_nx_spin.valueChanged.connect(lambda: self._schedule_redraw(self.show_grid_overlay))
+        self.grid_ny_spin.valueChanged.connect(lambda: self._schedule_redraw(self.show_grid_overlay))
         self.tab_widget.addTab(grid_tab, "Grid Overlay")
 
     # -------------------------------------------------------------------
@@ -2193,6 +2615,9 @@ class MainWindow(QMainWindow):
         self._bg_cache = None
         self._bg_cache_key = None
         self._bg_version += 1
+        if hasattr(self, 'plot_canvas'):
+            # The blitted overlay sits on the old background
+            self.plot_canvas.invalidate_overlay()
 
     def get_rotated_background_pixmap(self):
         """Return the background pixmap with current crop + rotation applied.
@@ -2430,56 +2855,89 @@ class MainWindow(QMainWindow):
     # -------------------------------------------------------------------
 
     def get_raw_intensity_data(self):
-        """Read the table widget contents into a NumPy array."""
+        """Return the table contents as a NumPy array.
+
+        ``self.intensity_data`` mirrors the table: cell edits and row/column
+        changes update it in place, and the widget is only re-read after
+        ``invalidate_cache`` drops it.
+        """
+        if self.intensity_data is not None:
+            return self.intensity_data
         rows = self.table_widget.rowCount()
         cols = self.table_widget.columnCount()
         if rows == 0 or cols == 0:
             return None
 
+        item = self.table_widget.item
+        parse = _cell_float
         data = np.zeros((rows, cols))
         for r in range(rows):
+            data_row = data[r]
             for c in range(cols):
-                item = self.table_widget.item(r, c)
-                try:
-                    data[r, c] = float(item.text()) if item and item.text() else 0.0
-                except (ValueError, TypeError):
-                    data[r, c] = 0.0
+                cell = item(r, c)
+                if cell is not None:
+                    data_row[c] = parse(cell.text())
+        self.intensity_data = data
         return data
 
-    def get_final_intensity_array(self):
-        """Resize the raw grid to match the image (or place in crop region)."""
-        from scipy.ndimage import zoom
+    def _cell_value(self, row, col):
+        """Numeric value of a table cell; blank or invalid cells count as 0."""
+        item = self.table_widget.item(row, col)
+        return _cell_float(item.text()) if item is not None else 0.0
+
+    def _set_table_mirror(self, data):
+        """Drop derived caches but keep *data* as the table mirror.
+
+        Cell edits write into the mirror, so a read-only array (e.g. one
+        pandas hands out under copy-on-write) is copied first.
+        """
+        self.invalidate_cache()
+        self._intensity_range = None  # keyed on the mirror, which may be edited in place
+        if data is not None and data.size:
+            if not data.flags.writeable:
+                data = data.copy()
+            self.intensity_data = data
+
+    def _on_cell_changed(self, row, col):
+        data = self.intensity_data
+        if data is not None and row < data.shape[0] and col < data.shape[1]:
+            data[row, col] = self._cell_value(row, col)
+            self._set_table_mirror(data)
+        else:
+            self.invalidate_cache()
+
+    def get_intensity_range(self):
+        """Return ``(min, max)`` of the table ignoring NaNs, or None.
+
+        Bilinear upsampling never leaves the range of its samples, so this
+        also bounds the upsampled array.  Cached per table mirror.
+        """
         raw_data = self.get_raw_intensity_data()
-        if raw_data is None or not self.original_pixmap:
+        if raw_data is None:
             return None
+        if self._intensity_range is None or self._intensity_range[0] is not raw_data:
+            valid_data = raw_data[~np.isnan(raw_data)]
+            if valid_data.size == 0:
+                return None
+            self._intensity_range = (raw_data, (float(valid_data.min()), float(valid_data.max())))
+        return self._intensity_range[1]
 
-        if self.crop_rect:
-            full_h, full_w = self.original_pixmap.height(), self.original_pixmap.width()
-            composite_array = np.full((full_h, full_w), np.nan, dtype=float)
-            crop_h, crop_w = self.crop_rect.height(), self.crop_rect.width()
-            zoom_y, zoom_x = crop_h / raw_data.shape[0], crop_w / raw_data.shape[1]
+    def get_overlay_intensity(self):
+        """Return ``(grid, region)`` for drawing the heatmap overlay.
 
-            try:
-                resized_intensity = zoom(raw_data, (zoom_y, zoom_x), order=1)
-            except Exception:
-                rep_y = max(1, int(np.ceil(zoom_y)))
-                rep_x = max(1, int(np.ceil(zoom_x)))
-                resized_intensity = np.repeat(np.repeat(raw_data, rep_y, axis=0), rep_x, axis=1)
-                resized_intensity = resized_intensity[:crop_h, :crop_w]
-
-            x, y = self.crop_rect.x(), self.crop_rect.y()
-            composite_array[y: y + crop_h, x: x + crop_w] = resized_intensity
-            return composite_array
-        else:
-            full_h, full_w = self.original_pixmap.height(), self.original_pixmap.width()
-            zoom_y, zoom_x = full_h / raw_data.shape[0], full_w / raw_data.shape[1]
-            try:
-                return zoom(raw_data, (zoom_y, zoom_x), order=1)
-            except Exception:
-                rep_y = max(1, int(np.ceil(zoom_y)))
-                rep_x = max(1, int(np.ceil(zoom_x)))
-                resized = np.repeat(np.repeat(raw_data, rep_y, axis=0), rep_x, axis=1)
-                return resized[:full_h, :full_w]
+        *grid* is the raw table; *region* is the ``(left, right, top,
+        bottom)`` fraction of the intensity frame it spans, i.e. the crop
+        rectangle in crop mode.  Returns None without data or image.
+        """
+        raw_data = self.get_raw_intensity_data()
+        if raw_data is None or not self.original_pixmap:
+            return None
+        if not self.crop_rect:
+            return raw_data, (0.0, 1.0, 0.0, 1.0)
+        full_w, full_h = self.original_pixmap.width(), self.original_pixmap.height()
+        r = self.crop_rect
+        return raw_data, (r.x() / full_w, (r.x() + r.width()) / full_w,
+                          r.y() / full_h, (r.y() + r.height()) / full_h)
 
     # -------------------------------------------------------------------
     # Blended view: heatmap / contours
@@ -2490,17 +2948,18 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "Load an image and intensity data first.")
             return
 
-        final_intensity = self.get_final_intensity_array()
-        if final_intensity is None:
+        overlay = self.get_overlay_intensity()
+        if overlay is None:
             QMessageBox.warning(self, "Warning", "Could not generate intensity data.")
             return
+        grid, region = overlay
 
-        valid_data = final_intensity[~np.isnan(final_intensity)]
-        if valid_data.size == 0:
+        data_range = self.get_intensity_range()
+        if data_range is None:
             QMessageBox.warning(self, "Warning", "No valid data to plot.")
             return
 
-        vmin, vmax = float(np.min(valid_data)), float(np.max(valid_data))
+        vmin, vmax = data_range
 
         self.vmin_spin.blockSignals(True)
         self.vmax_spin.blockSignals(True)
@@ -2517,10 +2976,11 @@ class MainWindow(QMainWindow):
         scale_y = float(self.scale_y_input.text()) if self.scale_y_input.text() else 1.0
 
         self.plot_canvas.draw_heatmap(
-            self.get_rotated_background_pixmap(), final_intensity,
+            self.get_rotated_background_pixmap(), grid,
             alpha=self.alpha, cmap=self.cmap,
             vmin=vmin, vmax=vmax, units=intensity_units,
-            scale_x=scale_x, scale_y=scale_y, distance_units=distance_units
+            scale_x=scale_x, scale_y=scale_y, distance_units=distance_units,
+            region=region
         )
         self._current_vis_mode = "heatmap"
 
@@ -2529,10 +2989,11 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Warning", "Load an image and intensity data first.")
             return
 
-        final_intensity = self.get_final_intensity_array()
-        if final_intensity is None:
+        overlay = self.get_overlay_intensity()
+        if overlay is None:
             QMessageBox.warning(self, "Warning", "Could not generate intensity data.")
             return
+        grid, region = overlay
 
         intensity_units = self.intensity_unit_input.text()
         distance_units = self.scale_unit_input.text()
@@ -2540,9 +3001,10 @@ class MainWindow(QMainWindow):
         scale_y = float(self.scale_y_input.text()) if self.scale_y_input.text() else 1.0
 
         self.plot_canvas.draw_contours(
-            self.get_rotated_background_pixmap(), final_intensity,
+            self.get_rotated_background_pixmap(), grid,
             alpha=self.alpha, cmap=self.cmap, levels=7,
-            units=intensity_units, scale_x=scale_x, scale_y=scale_y, distance_units=distance_units
+            units=intensity_units, scale_x=scale_x, scale_y=scale_y, distance_units=distance_units,
+            vrange=self.get_intensity_range(), region=region
         )
         self._current_vis_mode = "contour"
 
@@ -2551,11 +3013,10 @@ class MainWindow(QMainWindow):
     # -------------------------------------------------------------------
 
     def invalidate_cache(self):
-        """Mark cached intensity array as stale."""
-        self.cached_intensity_array = None
-        self.last_csv_data = None
-        self.last_csv_shape = None
-        self.last_pixmap_size = None
+        """Mark the table mirror and the drawn overlay as stale."""
+        self.intensity_data = None
+        if hasattr(self, 'plot_canvas'):
+            self.plot_canvas.invalidate_overlay()
 
     # -------------------------------------------------------------------
     # Intensity preview 
@@ -2567,13 +3028,12 @@ class MainWindow(QMainWindow):
 
         intensity = self.get_raw_intensity_data()
         fig = self.preview_canvas.figure
-        fig.clf()
-        ax = fig.add_subplot(111)
+        ax = self._clear_preview_axes()
 
         if intensity is None or intensity.size == 0:
             ax.text(0.5, 0.5, "No Data", ha='center', va='center')
             ax.axis('off')
-            self.preview_canvas.draw()
+            self.preview_canvas.draw_idle()
             return
 
         mode = self.preview_mode_combo.currentText()
@@ -2583,7 +3043,7 @@ class MainWindow(QMainWindow):
         if self.original_pixmap is None:
             try:
                 if mode == "Contour Map":
-                    ax.contourf(intensity, levels=7, cmap=cmap)
+                    self._preview_bands(ax, intensity, (0, cols - 1, 0, rows - 1), cmap)
                 else:
                     ax.imshow(intensity, cmap=cmap, aspect='auto')
             except Exception as e:
@@ -2591,16 +3051,15 @@ class MainWindow(QMainWindow):
                 ax.axis('off')
         else:
             bg_pixmap = self.current_pixmap if self.current_pixmap else self.original_pixmap
-            bg_arr = _pixmap_to_rgb_array(bg_pixmap)
+            bg_arr = self._preview_background(bg_pixmap)
 
             ax.imshow(bg_arr, extent=[0, cols, rows, 0], aspect='auto',
                       origin='upper', alpha=0.6)
 
             try:
                 if mode == "Contour Map":
-                    X = np.linspace(0, cols, cols)
-                    Y = np.linspace(0, rows, rows)
-                    ax.contourf(X, Y, intensity, levels=7, cmap=cmap, alpha=0.75)
+                    self._preview_bands(ax, intensity, (0, cols, 0, rows), cmap, alpha=0.75)
+                    ax.set_ylim(rows, 0)  # as set by the background image
                 else:
                     ax.imshow(intensity, cmap=cmap, aspect='auto', origin='upper',
                               extent=[0, cols, rows, 0], alpha=0.75)
@@ -2614,7 +3073,73 @@ class MainWindow(QMainWindow):
         ax.set_xticks([])
         ax.set_yticks([])
         fig.tight_layout()
-        self.preview_canvas.draw()
+        # Coalesced: a paste or row/column change can refresh the preview
+        # more than once before control returns to the event loop.
+        self.preview_canvas.draw_idle()
+
+    def _preview_bands(self, ax, intensity, box, cmap, **kwargs):
+        """Filled-contour preview of *intensity*, drawn like
+        ``draw_contours``: an image of the grid banded at the levels
+        ``contourf(levels=7)`` would use, so each update stays an
+        ``imshow``.  Samples span *box* ``(x0, x1, y0, y1)`` corner to
+        corner, row 0 at ``y0``; the view is limited to *box*.
+        """
+        rows, cols = intensity.shape
+        if rows < 2 or cols < 2:
+            raise TypeError(f"Input z must be at least a (2, 2) shaped array, but has shape {rows, cols}")
+        levels = _auto_levels(intensity, 7)
+        band_cmap = _band_cmap(colormaps[cmap], levels)
+        x0, x1, y0, y1 = box
+        half_x = (x1 - x0) / (2 * (cols - 1))
+        half_y = (y1 - y0) / (2 * (rows - 1))
+        ax.imshow(intensity, cmap=band_cmap, norm=BoundaryNorm(levels, band_cmap.N),
+                  interpolation='bilinear', interpolation_stage='data', aspect='auto',
+                  origin='lower', extent=[x0 - half_x, x1 + half_x, y0 - half_y, y1 + half_y],
+                  **kwargs)
+        ax.set_xlim(x0, x1)
+        ax.set_ylim(y0, y1)
+
+    def _clear_preview_axes(self):
+        """Return the preview Axes, emptied and reset to a fresh state.
+
+        The Axes is kept between updates: removing its artists is much
+        cheaper than ``clf()`` and ``add_subplot()``, which rebuild both
+        axes and their ticks on every table edit.
+        """
+        fig = self.preview_canvas.figure
+        if not fig.axes:
+            return fig.add_subplot(111)
+        ax = fig.axes[0]
+        for artist in (*ax.images, *ax.collections, *ax.texts):
+            artist.remove()
+        # What a new Axes would have: default placement (tight_layout
+        # moved it), (0, 1) limits with y increasing upward, autoscaled
+        # from the next artist alone, frame shown.
+        fig.subplotpars.reset()
+        ax.set_subplotspec(ax.get_subplotspec())
+        ax.ignore_existing_data_limits = True
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        ax.set_autoscale_on(True)
+        ax.axis('on')
+        return ax
+
+    def _preview_background(self, pixmap):
+        """*pixmap* as an RGB array no larger than the preview canvas.
+
+        The preview stretches the background over its axes, so anything
+        beyond the canvas's pixel size would only be resampled away again
+        on every table edit.  Cached per pixmap and canvas size.
+        """
+        ratio = self.preview_canvas.devicePixelRatioF()
+        width = min(pixmap.width(), max(1, round(self.preview_canvas.width() * ratio)))
+        height = min(pixmap.height(), max(1, round(self.preview_canvas.height() * ratio)))
+        key = (pixmap.cacheKey(), width, height)
+        if self._preview_bg is None or self._preview_bg[0] != key:
+            small = pixmap.scaled(width, height, Qt.AspectRatioMode.IgnoreAspectRatio,
+                                  Qt.TransformationMode.SmoothTransformation)
+            self._preview_bg = (key, _pixmap_to_rgb_array(small))
+        return self._preview_bg[1]
 
     # -------------------------------------------------------------------
     # Grid spinbox sync
@@ -2644,25 +3169,26 @@ class MainWindow(QMainWindow):
         )
         if file_name:
             try:
+                data = None
                 if file_name.endswith(".csv"):
-                    df = pd.read_csv(file_name, header=None)
+                    try:
+                        data = pd.read_csv(file_name, header=None, engine='c',
+                                           dtype=np.float64).to_numpy(copy=True)
+                    except ValueError:
+                        df = pd.read_csv(file_name, header=None)
                 else:
                     df = pd.read_excel(file_name, header=None)
 
-                data = df.values
+                if data is None:
+                    # Non-numeric cells read as 0.0, same as the table readout
+                    numeric = df.apply(pd.to_numeric, errors='coerce')
+                    data = numeric.where(numeric.notna() | df.isna(), 0.0).to_numpy(np.float64, copy=True)
                 rows, cols = data.shape
 
-                self.table_widget.blockSignals(True)
-                self.table_widget.setRowCount(rows)
-                self.table_widget.setColumnCount(cols)
-
-                for r in range(rows):
-                    for c in range(cols):
-                        self.table_widget.setItem(r, c, QTableWidgetItem(str(data[r, c])))
-
-                self.table_widget.blockSignals(False)
-                self.intensity_data = data
-                self.invalidate_cache()
+                # tolist() converts to Python floats in one C pass; their
+                # str() matches numpy's, without boxing a scalar per cell.
+                self._fill_table(rows, cols, (map(str, row) for row in data.tolist()))
+                self._set_table_mirror(data)
                 self.update_intensity_preview()
                 self.set_grid_spinboxes_from_data()
 
@@ -2674,88 +3200,143 @@ class MainWindow(QMainWindow):
         text = clipboard.text()
 
         if text:
-            rows = [r for r in text.split('\n') if r.strip()]
-            data = [r.split('\t') for r in rows]
-            row_count = len(data)
-            col_count = max(len(row) for row in data) if row_count > 0 else 0
-
-            self.table_widget.blockSignals(True)
-            self.table_widget.setRowCount(row_count)
-            self.table_widget.setColumnCount(col_count)
-
-            for r, row in enumerate(data):
-                for c, val in enumerate(row):
-                    try:
-                        num_val = float(val)
-                    except ValueError:
-                        num_val = 0.0
-                    self.table_widget.setItem(r, c, QTableWidgetItem(str(num_val)))
-
-            self.table_widget.blockSignals(False)
-            self.invalidate_cache()
+            data = lengths = None
+            if text.strip():
+                try:
+                    # Fast path: a clean numeric block, parsed in C
+                    data = np.loadtxt(io.StringIO(text, newline=None), delimiter='\t',
+                                      dtype=np.float64, comments=None, ndmin=2)
+                except ValueError:
+                    pass
+            if data is None:
+                # Ragged rows or non-numeric cells (read as 0.0); short rows
+                # leave their trailing cells empty
+                rows = [r.split('\t') for r in text.split('\n') if r.strip()]
+                lengths = [len(row) for row in rows]
+                data = np.zeros((len(rows), max(lengths, default=0)))
+                for r, row in enumerate(rows):
+                    for c, val in enumerate(row):
+                        try:
+                            data[r, c] = float(val)
+                        except ValueError:
+                            pass
+            row_count, col_count = data.shape
+
+            values = data.tolist()
+            if lengths is not None:
+                values = [row[:n] for row, n in zip(values, lengths)]
+            self._fill_table(row_count, col_count, (map(str, row) for row in values))
+            self._set_table_mirror(data)
             self.update_intensity_preview()
             self.set_grid_spinboxes_from_data()
 
+    def _fill_table(self, rows, cols, texts):
+        """Resize the table and fill it from *texts*, an iterable of rows of
+        cell strings.
+
+        Signals and repaints are suspended for the bulk ``setItem`` run so
+        the view is laid out and painted once, at the end.  Existing items
+        are cleared first, so cells *texts* leaves out show as empty.
+        """
+        table = self.table_widget
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.clearContents()
+            table.setRowCount(rows)
+            table.setColumnCount(cols)
+            for r, row in enumerate(texts):
+                for c, text in enumerate(row):
+                    table.setItem(r, c, QTableWidgetItem(text))
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
     # -------------------------------------------------------------------
     # Table row / column management
     # -------------------------------------------------------------------
 
+    # New cells are blank (read as 0), so the mirror is padded or trimmed
+    # to match rather than rebuilt from the widget.
+
     def add_row(self):
         self.table_widget.insertRow(self.table_widget.rowCount())
-        self.invalidate_cache()
-        self.update_intensity_preview()
-        self.set_grid_spinboxes_from_data()
+        data = self.intensity_data
+        if data is not None:
+            data = np.vstack([data, np.zeros((1, data.shape[1]))])
+        self._set_table_mirror(data)
+        self._table_refresh_timer.start()
 
     def remove_row(self):
         if self.table_widget.rowCount() > 0:
             self.table_widget.removeRow(self.table_widget.rowCount() - 1)
-            self.invalidate_cache()
-            self.update_intensity_preview()
-            self.set_grid_spinboxes_from_data()
+            data = self.intensity_data
+            self._set_table_mirror(data[:-1].copy() if data is not None else None)
+            self._table_refresh_timer.start()
 
     def add_column(self):
         self.table_widget.insertColumn(self.table_widget.columnCount())
-        self.invalidate_cache()
-        self.update_intensity_preview()
-        self.set_grid_spinboxes_from_data()
+        data = self.intensity_data
+        if data is not None:
+            data = np.hstack([data, np.zeros((data.shape[0], 1))])
+        self._set_table_mirror(data)
+        self._table_refresh_timer.start()
 
     def remove_column(self):
         if self.table_widget.columnCount() > 0:
             self.table_widget.removeColumn(self.table_widget.columnCount() - 1)
-            self.invalidate_cache()
-            self.update_intensity_preview()
-            self.set_grid_spinboxes_from_data()
+            data = self.intensity_data
+            self._set_table_mirror(data[:, :-1].copy() if data is not None else None)
+            self._table_refresh_timer.start()
+
+    def _refresh_table_views(self):
+        self.update_intensity_preview()
+        self.set_grid_spinboxes_from_data()
 
     # --- Visualization Controls ---
     def update_alpha(self):
         value = self.alpha_slider.value()
         self.alpha = value / 100.0
-        self.update_display()
+        self._schedule_redraw(self._restyle_or_redraw)
 
     def update_cmap(self):
-        cmap_name = self.cmap_combo.currentText()
-        if cmap_name == "Threat Zones (7)":
-            self.cmap = get_threat_zone_cmap()
-        elif cmap_name == "Dose Field (7)":
-            self.cmap = get_continuous_dose_cmap()
-        else:
-            self.cmap = cmap_name
+        # Kept as the name (custom maps included, see _resolve_cmap) so
+        # the overlay colormap comes from _overlay_cmap's cache.
+        self.cmap = self.cmap_combo.currentText()
+        self._schedule_redraw(self._restyle_or_redraw)
+
+    def _restyle_or_redraw(self):
+        """Apply alpha/cmap by blitting the heatmap overlay when possible."""
+        if (self.tab_widget.currentIndex() == 2
+                and self._current_vis_mode != "contour"
+                and self.plot_canvas.restyle_overlay(alpha=self.alpha, cmap=self.cmap)):
+            return
         self.update_display()
 
+    def _schedule_redraw(self, action):
+        """Run *action* once the control settles (at most once per frame)."""
+        self._redraw_actions[action] = None
+        self._redraw_timer.start()
+
+    def _do_redraw(self):
+        actions, self._redraw_actions = self._redraw_actions, {}
+        for action in actions:
+            action()
+
     def update_colormap_scale(self):
         if not self.original_pixmap or self.table_widget.rowCount() == 0:
             return
 
-        final_intensity = self.get_final_intensity_array()
-        if final_intensity is None:
+        overlay = self.get_overlay_intensity()
+        if overlay is None:
             return
+        grid, region = overlay
 
-        valid_data = final_intensity[~np.isnan(final_intensity)]
-        if valid_data.size == 0:
+        data_range = self.get_intensity_range()
+        if data_range is None:
             return
 
-        data_min = float(np.min(valid_data))
-        data_max = float(np.max(valid_data))
+        data_min, data_max = data_range
 
         # Block signals while adjusting range so that clamping doesn't
         # re-trigger this method in a feedback loop.
@@ -2775,19 +3356,20 @@ class MainWindow(QMainWindow):
 
         if hasattr(self, '_current_vis_mode') and self._current_vis_mode == "contour":
             self.plot_canvas.draw_contours(
-                self.get_rotated_background_pixmap(), final_intensity,
+                self.get_rotated_background_pixmap(), grid,
                 alpha=self.alpha, cmap=self.cmap,
                 levels=np.linspace(vmin, vmax, 20),
                 units=intensity_units, scale_x=scale_x, scale_y=scale_y,
-                distance_units=distance_units
+                distance_units=distance_units, region=region
             )
-        else:
+        elif (self.tab_widget.currentIndex() != 2
+                or not self.plot_canvas.restyle_overlay(clim=(vmin, vmax))):
             self.plot_canvas.draw_heatmap(
-                self.get_rotated_background_pixmap(), final_intensity,
+                self.get_rotated_background_pixmap(), grid,
                 alpha=self.alpha, cmap=self.cmap,
                 vmin=vmin, vmax=vmax,
                 units=intensity_units, scale_x=scale_x, scale_y=scale_y,
-                distance_units=distance_units
+                distance_units=distance_units, region=region
             )
 
     def apply_formatting(self):
@@ -2819,25 +3401,12 @@ class MainWindow(QMainWindow):
 
         xlim = self.plot_canvas.ax.get_xlim()
         ylim = self.plot_canvas.ax.get_ylim()
-        x_tick_positions1 = np.linspace(xlim[0], xlim[1], x_ticks)
-        y_tick_positions1 = np.linspace(ylim[0], ylim[1], y_ticks)
+        self.plot_canvas.ax.set_xticks(_rounded_ticks(xlim[0], xlim[1], x_ticks))
+        self.plot_canvas.ax.set_yticks(_rounded_ticks(ylim[0], ylim[1], y_ticks))
 
-        x_tick_positions = np.round(x_tick_positions1 / 50) * 50
-        y_tick_positions = np.round(y_tick_positions1 / 50) * 50
-
-        if xlim[0] <= 0 <= xlim[1] and 0 not in x_tick_positions:
-            x_tick_positions = np.append(x_tick_positions, 0)
-            x_tick_positions = np.sort(x_tick_positions)
-
-        if ylim[0] <= 0 <= ylim[1] and 0 not in y_tick_positions:
-            y_tick_positions = np.append(y_tick_positions, 0)
-            y_tick_positions = np.sort(y_tick_positions)
-
-        self.plot_canvas.ax.set_xticks(x_tick_positions)
-        self.plot_canvas.ax.set_yticks(y_tick_positions)
-
-        self.plot_canvas.ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.0f}'))
-        self.plot_canvas.ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:.0f}'))
+        # One formatter per axis (Matplotlib binds a formatter to its axis)
+        self.plot_canvas.ax.xaxis.set_major_formatter(FuncFormatter(_format_int_tick))
+        self.plot_canvas.ax.yaxis.set_major_formatter(FuncFormatter(_format_int_tick))
 
         if hasattr(self.plot_canvas, 'cbar') and self.plot_canvas.cbar is not None:
             self.plot_canvas.cbar.ax.yaxis.label.set_fontsize(label_fontsize)
@@ -2884,21 +3453,22 @@ class MainWindow(QMainWindow):
                 raise ValueError("Enter 2-7 values")
 
             levels = sorted(levels)
-            final_intensity = self.get_final_intensity_array()
+            grid, region = self.get_overlay_intensity()
             distance_units = self.scale_unit_input.text()
             scale_x = float(self.scale_x_input.text()) if self.scale_x_input.text() else 1.0
             scale_y = float(self.scale_y_input.text()) if self.scale_y_input.text() else 1.0
 
-            base_cmap = plt.get_cmap(self.cmap)
+            base_cmap = _resolve_cmap(self.cmap)
             colors = base_cmap(np.linspace(0, 1, len(levels) - 1))
             custom_cmap = ListedColormap(colors)
             custom_cmap.set_under((0, 0, 0, 0))
 
             self.plot_canvas.draw_contours(
-                self.get_rotated_background_pixmap(), final_intensity,
+                self.get_rotated_background_pixmap(), grid,
                 alpha=self.alpha, cmap=custom_cmap, levels=levels,
                 units=self.intensity_unit_input.text(), extend='min',
-                scale_x=scale_x, scale_y=scale_y, distance_units=distance_units
+                scale_x=scale_x, scale_y=scale_y, distance_units=distance_units,
+                region=region
             )
 
         except Exception as e:
@@ -2908,6 +3478,23 @@ class MainWindow(QMainWindow):
     # Highlight levels 
     # -------------------------------------------------------------------
 
+    def _highlight_contour_grid(self, grid, region):
+        """Return ``(X, Y, Z)`` for contouring on a low-res intensity grid.
+
+        The grid is upsampled to HIGHLIGHT_SUBSTEPS samples per table cell,
+        enough to follow the curved bilinear iso-lines to well under a
+        pixel while contouring far fewer points than the full image.  The
+        samples span *region* corner to corner, matching the heatmap.
+        ``Z`` is flipped to match the bottom-up Y axis.
+        """
+        x0, x1, y0, y1 = self.plot_canvas.region_box(region)
+        rows = min(max(int(y1 - y0), 2), max(grid.shape[0] - 1, 1) * HIGHLIGHT_SUBSTEPS + 1)
+        cols = min(max(int(x1 - x0), 2), max(grid.shape[1] - 1, 1) * HIGHLIGHT_SUBSTEPS + 1)
+        fine = _upsample_intensity(grid, rows, cols)
+        X = np.linspace(x0, x1, cols)
+        Y = np.linspace(y0, y1, rows)
+        return X, Y, np.flipud(fine)
+
     def apply_highlights(self):
         """Draw highlight contour lines and labels at specified dose values.
 
@@ -2931,10 +3518,11 @@ class MainWindow(QMainWindow):
                                 "Invalid highlight values. Please enter comma-separated numbers.")
             return
 
-        final_intensity = self.get_final_intensity_array()
-        if final_intensity is None:
+        overlay = self.get_overlay_intensity()
+        if overlay is None:
             QMessageBox.warning(self, "Warning", "Could not generate intensity data.")
             return
+        grid, region = overlay
 
         # Store highlight settings for re-application after drag
         self.last_highlight_values = highlight_values
@@ -2951,46 +3539,42 @@ class MainWindow(QMainWindow):
 
         if self._current_vis_mode == "contour":
             self.plot_canvas.draw_contours(
-                base_img, final_intensity, alpha=self.alpha, cmap=self.cmap,
+                base_img, grid, alpha=self.alpha, cmap=self.cmap,
                 levels=20, units=intensity_units,
                 scale_x=scale_x, scale_y=scale_y, distance_units=distance_units,
+                vrange=self.get_intensity_range(), region=region,
             )
         else:
             self.plot_canvas.draw_heatmap(
-                base_img, final_intensity, alpha=self.alpha, cmap=self.cmap,
+                base_img, grid, alpha=self.alpha, cmap=self.cmap,
                 vmin=vmin, vmax=vmax, units=intensity_units,
                 scale_x=scale_x, scale_y=scale_y, distance_units=distance_units,
+                region=region,
             )
 
-        image = base_img.toImage().convertToFormat(QImage.Format.Format_RGBA8888)
-        width, height = image.width(), image.height()
-        extent = [-width / 2, width / 2, -height / 2, height / 2]
-
-        rows, cols = final_intensity.shape
-        X = np.linspace(extent[0] + self.plot_canvas.intensity_offset_x,
-                        extent[1] + self.plot_canvas.intensity_offset_x, cols)
-        Y = np.linspace(extent[2] + self.plot_canvas.intensity_offset_y,
-                        extent[3] + self.plot_canvas.intensity_offset_y, rows)
-        xx, yy = np.meshgrid(X, Y)
+        X, Y, intensity_for_contour = self._highlight_contour_grid(grid, region)
 
-        intensity_for_contour = np.flipud(final_intensity)
+        palette = HIGHLIGHT_COLORS[:1] if self.color_combo.currentText() == "White Only" else HIGHLIGHT_COLORS
+        colors = palette[np.arange(len(highlight_values)) % len(palette)]
 
-        if self.color_combo.currentText() == "White Only":
-            colors = ["white"] * len(highlight_values)
-        else:
-            base_colors = ["white", "black", "red", "yellow", "green", "cyan"]
-            colors = [base_colors[i % len(base_colors)] for i in range(len(highlight_values))]
-
-        legend_handles = []
+        # One contour pass for every level.  Levels must be increasing and
+        # unique; a repeated value keeps its last colour, as when each
+        # value was drawn on top of the previous one.
+        level_colors = dict(zip(highlight_values, colors))
+        levels = sorted(level_colors)
+        cs = self.plot_canvas.ax.contour(
+            X, Y, intensity_for_contour,
+            levels=levels, colors=np.array([level_colors[v] for v in levels]), linewidths=2,
+            algorithm='serial',
+        )
+        self.plot_canvas.ax.clabel(cs, inline=True, fmt={v: f"{v}" for v in levels},
+                                   fontsize=10)
+        self.plot_canvas.highlight_cs = cs
 
-        for i, value in enumerate(highlight_values):
-            cs = self.plot_canvas.ax.contour(
-                xx, yy, intensity_for_contour,
-                levels=[value], colors=[colors[i]], linewidths=2,
-            )
-            self.plot_canvas.ax.clabel(cs, inline=True, fmt=f"{value}", fontsize=10)
-            line = mlines.Line2D([], [], color=colors[i], linewidth=2, label=f"{value}")
-            legend_handles.append(line)
+        legend_handles = [
+            mlines.Line2D([], [], color=colors[i], linewidth=2, label=f"{value}")
+            for i, value in enumerate(highlight_values)
+        ]
 
         if legend_handles:
             self.plot_canvas.ax.legend(handles=legend_handles, loc="best")
@@ -3015,23 +3599,22 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Warning", "Load image and data first")
                 return
 
-            final_intensity = self.get_final_intensity_array()
-
+            grid, region = self.get_overlay_intensity()
             if hasattr(self, '_current_vis_mode') and self._current_vis_mode == "contour":
                 self.plot_canvas.draw_contours(
-                    self.get_rotated_background_pixmap(), final_intensity,
+                    self.get_rotated_background_pixmap(), grid,
                     alpha=self.alpha, cmap=self.cmap,
                     levels=np.linspace(self.vmin_spin.value(), self.vmax_spin.value(), 20),
                     units=intensity_units, scale_x=scale_x, scale_y=scale_y,
-                    distance_units=distance_units
+                    distance_units=distance_units, region=region
                 )
             else:
                 self.plot_canvas.draw_heatmap(
-                    self.get_rotated_background_pixmap(), final_intensity,
+                    self.get_rotated_background_pixmap(), grid,
                     alpha=self.alpha, cmap=self.cmap,
                     vmin=self.vmin_spin.value(), vmax=self.vmax_spin.value(),
                     units=intensity_units, scale_x=scale_x, scale_y=scale_y,
-                    distance_units=distance_units
+                    distance_units=distance_units, region=region
                 )
 
         except ValueError:
@@ -3140,30 +3723,12 @@ class MainWindow(QMainWindow):
             return
 
         try:
-            arr_rgb = _pixmap_to_rgb_array(self.get_rotated_background_pixmap())
-            height, width = arr_rgb.shape[:2]
-
-            self.grid_canvas.ax.clear()
-            self.grid_canvas.ax.imshow(arr_rgb, aspect='equal', extent=[0, width, 0, height], origin='upper')
-
-            cols = self.grid_nx_spin.value()
-            rows = self.grid_ny_spin.value()
-
-            x = np.linspace(0, width, cols + 1)
-            y = np.linspace(0, height, rows + 1)
-
-            if self.grid_type_combo.currentText() == "Points":
-                xx, yy = np.meshgrid(x, y)
-                self.grid_canvas.ax.plot(xx, yy, 'r.', markersize=2)
-            else:
-                for xi in x:
-                    self.grid_canvas.ax.plot([xi, xi], [0, height], 'r:', linewidth=0.5)
-                for yi in y:
-                    self.grid_canvas.ax.plot([0, width], [yi, yi], 'r:', linewidth=0.5)
-
-            self.grid_canvas.ax.set_xlim([0, width])
-            self.grid_canvas.ax.set_ylim([0, height])
-            self.grid_canvas.draw()
+            self.grid_canvas.draw_grid(
+                self.get_rotated_background_pixmap(),
+                self.grid_nx_spin.value(),
+                self.grid_ny_spin.value(),
+                points=self.grid_type_combo.currentText() == "Points",
+            )
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to show grid overlay: {str(e)}")
@@ -3260,13 +3825,7 @@ class MainWindow(QMainWindow):
         if table_data:
             rows = len(table_data)
             cols = max(len(row) for row in table_data) if rows else 0
-            self.table_widget.blockSignals(True)
-            self.table_widget.setRowCount(rows)
-            self.table_widget.setColumnCount(cols)
-            for r, row in enumerate(table_data):
-                for c, val in enumerate(row):
-                    self.table_widget.setItem(r, c, QTableWidgetItem(val))
-            self.table_widget.blockSignals(False)
+            self._fill_table(rows, cols, table_data)
 
         angle = session.get('rotation_angle', 0)
         self.rotation_slider.setValue(angle)
@@ -3336,23 +3895,24 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Release heavy resources on window close."""
+        self._table_refresh_timer.stop()
         try:
             if hasattr(self, 'plot_canvas') and self.plot_canvas.figure:
-                self.plot_canvas.figure.clear()
-                plt.close(self.plot_canvas.figure)
+                self.plot_canvas.release()
 
             if hasattr(self, 'grid_canvas') and self.grid_canvas.figure:
-                self.grid_canvas.figure.clear()
-                plt.close(self.grid_canvas.figure)
+                self.grid_canvas.release()
         except Exception:
             pass
 
         self.original_pixmap = None
         self.current_pixmap = None
-        self.cached_intensity_array = None
+        self.intensity_data = None
+        self._intensity_range = None
         self._bg_cache = None
+        self._preview_bg = None
 
-        gc.collect()
+        gc.collect()  # Full collection: frees the artist/renderer cycles
         super().closeEvent(event)
 
 
@@ -3441,7 +4001,7 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
-    # Start background preloading of pandas/scipy/fitz/PIL now that the
+    # Start background preloading of pandas/fitz/PIL now that the
     # window is visible.  By the time the user clicks "Load CSV" or
     # "Load Image (PDF)", these will already be imported and ready.
     QTimer.singleShot(0, start_background_preload)
@@ -46,6 +46,7 @@ class MRIApp:
         self.fig, self.ax = plt.subplots(figsize=(4, 2))
         self.hist_canvas = FigureCanvasTkAgg(self.fig, master=self.image_frame)
         self.hist_canvas.get_tk_widget().grid(row=0, column=1)
+        self.hist_canvas.mpl_connect('draw_event', self.on_hist_draw)
 
         # Sliders for controlling lower and upper thresholds
         self.lower_thresh_slider = tk.Scale(self.master, orient=tk.HORIZONTAL, label="Lower Threshold")
@@ -78,6 +79,10 @@ class MRIApp:
 
         self.image_data = None
         self.seed = None
+        self.window_span = None
+        self.hist_limits = None
+        self.hist_background = None
+        self.redraw_job = None
 
     def load_file(self):
         try:
@@ -91,6 +96,8 @@ class MRIApp:
 
                 if hasattr(self.dicom_data, 'pixel_array'):
                     self.image_data = self.dicom_data.pixel_array
+                    # New image: rebuild the histogram bars on the next update
+                    self.window_span = None
                     # Bind click event for selecting seed point
                     self.canvas.bind("<Button-1>", self.on_click)
                     # Bind motion event to show grey value
@@ -185,13 +192,13 @@ class MRIApp:
                 # Perform region growing for the signal region
                 mask = self.region_growing(self.image_data, self.seed, lower_thresh, upper_thresh)
 
-                if mask is None or np.sum(mask) == 0:
+                if mask is None or not mask.any():
                     # If signal region growing fails, try growing the background
                     messagebox.showwarning("Warning",
                                            "Segmentation for the signal region failed. Trying to grow background.")
                     mask = self.region_growing(self.image_data, self.seed, 0, lower_thresh)
 
-                if mask is not None and np.sum(mask) > 0:
+                if mask is not None and mask.any():
                     # Create buffer region around the segmented signal
                     buffer = self.create_buffer_region(mask)
 
@@ -221,7 +228,7 @@ class MRIApp:
             mask = sitk.GetArrayFromImage(seg)
 
             # Ensure the mask has valid regions
-            if np.sum(mask) > 0:
+            if mask.any():
                 return mask
             else:
                 return None
@@ -231,10 +238,16 @@ class MRIApp:
 
     def create_buffer_region(self, mask):
         try:
-            # Create a buffer by dilating the mask
-            dilated_mask = ndi.binary_dilation(mask, iterations=3)
-            buffer = dilated_mask ^ mask  # Buffer is the difference between dilated and original mask
-            return buffer.astype(int)
+            # Buffer is every pixel within 3 city-block steps of the mask (the same
+            # ring as 3 binary dilations), thresholded from a distance transform
+            # computed over the mask's bounding box only
+            buffer = np.zeros(mask.shape, dtype=int)
+            bbox = ndi.find_objects((mask != 0).astype(np.uint8))
+            if bbox:
+                bbox = tuple(slice(max(s.start - 3, 0), s.stop + 3) for s in bbox[0])
+                distance = ndi.distance_transform_cdt(mask[bbox] == 0, metric='taxicab')
+                buffer[bbox] = (distance > 0) & (distance <= 3)
+            return buffer
         except Exception as e:
             messagebox.showerror("Error", f"Failed to create buffer region: {str(e)}")
             return np.zeros_like(mask)
@@ -268,8 +281,21 @@ class MRIApp:
 
     def update_histogram(self):
         try:
-            self.ax.clear()
-            self.ax.hist(self.image_data.ravel(), bins=256, color='blue', alpha=0.7)
+            if self.window_span is None:
+                # Bin the image once per load; window changes only move the span
+                counts, edges = np.histogram(self.image_data, bins=256)
+                self.ax.clear()
+                self.ax.hist(edges[:-1], bins=edges, weights=counts, color='blue', alpha=0.7)
+                self.ax.set_title("Intensity Histogram")
+                self.ax.set_xlabel("Intensity Value")
+                self.ax.set_ylabel("Frequency")
+                self.hist_limits = self.ax.dataLim.get_points().copy()
+                old_xlim = None
+            else:
+                old_xlim = self.ax.get_xlim()
+                self.window_span.remove()
+                # Back to the bars' data limits (cheaper than relim over every bar)
+                self.ax.dataLim.set_points(self.hist_limits.copy())
 
             # Add shaded region for window level and width
             window_level = self.window_level_slider.get()
@@ -277,23 +303,46 @@ class MRIApp:
             min_pixel = window_level - (window_width / 2)
             max_pixel = window_level + (window_width / 2)
 
-            self.ax.axvspan(min_pixel, max_pixel, color='red', alpha=0.3)
-            self.ax.set_title("Intensity Histogram")
-            self.ax.set_xlabel("Intensity Value")
-            self.ax.set_ylabel("Frequency")
-            self.hist_canvas.draw()
+            self.window_span = self.ax.axvspan(min_pixel, max_pixel, color='red', alpha=0.3, animated=True)
+            if self.hist_background is not None and self.ax.get_xlim() == old_xlim:
+                # Only the span moved: restore the cached bars and blit the new span
+                self.hist_canvas.restore_region(self.hist_background)
+                self.ax.draw_artist(self.window_span)
+                self.hist_canvas.blit(self.ax.bbox)
+            else:
+                self.hist_canvas.draw()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to update histogram: {str(e)}")
 
+    def on_hist_draw(self, _event):
+        # Cache the histogram without the (animated) window span after every full
+        # draw, then paint the span on top so resizes and redraws keep it
+        self.hist_background = self.hist_canvas.copy_from_bbox(self.ax.bbox)
+        if self.window_span is not None:
+            self.ax.draw_artist(self.window_span)
+
     def update_display(self, _event=None):
-        # Update the image display and histogram when windowing sliders are adjusted
-        self.display_image()
+        # Update the image display and histogram when windowing sliders are adjusted.
+        # Slider drags fire on every step, so redraw at most once per 40 ms; the
+        # redraw reads the sliders when it runs, so the latest values are shown
+        if self.redraw_job is None:
+            self.redraw_job = self.master.after(40, self.redraw_window)
+
+    def redraw_window(self):
+        self.redraw_job = None
+        if self.image_data is not None:
+            self.display_image()
 
     def reset(self):
         # Reset the application
+        if self.redraw_job is not None:
+            self.master.after_cancel(self.redraw_job)
+            self.redraw_job = None
         self.canvas.delete("all")
         self.image_data = None
         self.seed = None
+        self.window_span = None
+        self.hist_limits = None
         self.lower_thresh_slider.set(0)
         self.upper_thresh_slider.set(0)
         self.window_level_slider.set(0)
@@ -0,0 +1,49 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication
+
+import HeatMapBlenderTool
+
+
+class PasteClipboardTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.window = HeatMapBlenderTool.MainWindow()
+
+    def tearDown(self):
+        self.window.close()
+
+    def paste(self, text):
+        QApplication.clipboard().setText(text)
+        self.window.paste_clipboard_data()
+
+    def table_texts(self):
+        table = self.window.table_widget
+        return [[table.item(r, c).text() if table.item(r, c) else ''
+                 for c in range(table.columnCount())]
+                for r in range(table.rowCount())]
+
+    def test_ragged_paste_over_filled_table(self):
+        self.paste("1\t2\t3\n4\t5\t6\n")
+        self.paste("7\t8\t9\n10\n")
+
+        # Short rows show as empty, not as the previous paste's cells
+        self.assertEqual(self.table_texts(), [['7.0', '8.0', '9.0'], ['10.0', '', '']])
+        # ... and the plotted data matches what the table shows
+        expected = [[7.0, 8.0, 9.0], [10.0, 0.0, 0.0]]
+        self.assertEqual(self.window.get_raw_intensity_data().tolist(), expected)
+        self.window.invalidate_cache()
+        self.assertEqual(self.window.get_raw_intensity_data().tolist(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()